@@ -11,15 +11,26 @@ Rules-based Manse (만세력) pillars without DB.
 - Optional LMT shift for hour boundaries
 """
 import math
+import re
 import argparse
+import bisect
 import json
 import sys
 import datetime
+import functools
 from typing import Optional
 
+try:  # optional C encoder for the CLI output; stdlib json is used otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
 TEN_STEMS = ['甲','乙','丙','丁','戊','己','庚','辛','壬','癸']
 TWELVE_BRANCHES = ['子','丑','寅','卯','辰','巳','午','未','申','酉','戌','亥']
 
+_STEM_IDX = {c: i for i, c in enumerate(TEN_STEMS)}
+_BRANCH_IDX = {c: i for i, c in enumerate(TWELVE_BRANCHES)}
+
 KOREAN_STEMS = {
     '甲': '갑',
     '乙': '을',
@@ -47,169 +58,243 @@ KOREAN_BRANCHES = {
     '亥': '해',
 }
 
+# Hangul reading of every stem+branch pair, e.g. '甲子' -> '갑자'
+_GANZHI_KOREAN = {s + b: KOREAN_STEMS[s] + KOREAN_BRANCHES[b] for s in TEN_STEMS for b in TWELVE_BRANCHES}
+
 def ganzhi_to_korean(gz: str) -> str:
     if not isinstance(gz, str) or len(gz) != 2:
         raise ValueError(f"Invalid ganzhi: {gz!r}")
     try:
-        return KOREAN_STEMS[gz[0]] + KOREAN_BRANCHES[gz[1]]
+        return _GANZHI_KOREAN[gz]
     except KeyError as e:
         raise ValueError(f"Invalid ganzhi char: {gz!r}") from e
 
+# Prebuilt pillar strings: by sexagenary index, and by stem*12 + branch.
+_GANZHI_60 = tuple(TEN_STEMS[i % 10] + TWELVE_BRANCHES[i % 12] for i in range(60))
+_STEM_BRANCH_120 = tuple(s + b for s in TEN_STEMS for b in TWELVE_BRANCHES)
+
 def ganzhi_from_index(i60:int) -> str:
-    return TEN_STEMS[i60 % 10] + TWELVE_BRANCHES[i60 % 12]
+    return _GANZHI_60[i60 % 60]
 
 # ── Gregorian ↔ JD ───────────────────────────────────────────────────────────
+def gregorian_to_jdn(y:int,m:int,d:int) -> int:
+    """Julian Day Number (noon-based) of a proleptic Gregorian date; integer-only."""
+    a = (14 - m) // 12
+    y2 = y + 4800 - a
+    m2 = m + 12*a - 3
+    return d + (153*m2 + 2)//5 + 365*y2 + y2//4 - y2//100 + y2//400 - 32045
+
 def gregorian_to_jd(y:int,m:int,d:int,h:float=12,mi:float=0,se:float=0) -> float:
-    if m <= 2:
-        y -= 1; m += 12
-    A = y // 100
-    B = 2 - A + (A // 4)
-    frac = (h + mi/60 + se/3600) / 24.0
-    return int(365.25*(y+4716)) + int(30.6001*(m+1)) + d + B - 1524.5 + frac
+    return gregorian_to_jdn(y,m,d) - 0.5 + (h*3600 + mi*60 + se) / 86400.0
 
 # ── Solar ecliptic longitude (low precision, Meeus-like) ────────────────────
+# Memoized: lru_cache only hits on exactly equal JDs. In practice that is the birth JD,
+# which manse_calc evaluates and _next_prev_term_times then seeds _refine_term_time with.
+_DEG_TO_RAD = math.pi / 180.0  # same factor math.radians() applies
+
+@functools.lru_cache(maxsize=4096)
 def sun_ecliptic_longitude_deg(JD:float) -> float:
+    sin = math.sin
     T = (JD - 2451545.0) / 36525.0
-    M  = 357.52911 + 35999.05029*T - 0.0001537*(T**2)
-    L0 = 280.46646 + 36000.76983*T + 0.0003032*(T**2)
-    Mr = math.radians(M % 360.0)
-    C = (1.914602 - 0.004817*T - 0.000014*(T**2))*math.sin(Mr) \
-      + (0.019993 - 0.000101*T)*math.sin(2*Mr) \
-      + 0.000289*math.sin(3*Mr)
+    # Polynomials in T in Horner form
+    M  = 357.52911 + T*(35999.05029 - 0.0001537*T)
+    L0 = 280.46646 + T*(36000.76983 + 0.0003032*T)
+    Mr = (M % 360.0) * _DEG_TO_RAD
+    # Direct sin(2M)/sin(3M) calls: in CPython the multiple-angle identities
+    # (2sc, s(3-4s^2)) cost more bytecode than the C sin() they replace.
+    C = (1.914602 - T*(0.004817 + 0.000014*T))*sin(Mr) \
+      + (0.019993 - 0.000101*T)*sin(2*Mr) \
+      + 0.000289*sin(3*Mr)
     true_long = L0 + C
     omega = 125.04 - 1934.136*T
-    lam = true_long - 0.00569 - 0.00478*math.sin(math.radians(omega))
+    lam = true_long - 0.00569 - 0.00478*sin(omega * _DEG_TO_RAD)
     return lam % 360.0
 
+def _brentq(f, a:float, b:float, xtol:float=1e-9, rtol:float=4*sys.float_info.epsilon, maxiter:int=60) -> Optional[float]:
+    """Brent's root finder on a sign-changing bracket [a,b] (classic zbrent formulation).
+
+    Returns None if [a,b] does not bracket a root or if it has not converged after maxiter steps.
+    """
+    fa, fb = f(a), f(b)
+    if fa == 0: return a
+    if fb == 0: return b
+    if fa * fb > 0:
+        return None
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2*rtol*abs(b) + 0.5*xtol
+        m = 0.5*(c - b)
+        if abs(m) <= tol or fb == 0:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:  # secant
+                p = 2*m*s
+                q = 1 - s
+            else:       # inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s*(2*m*q*(q - r) - (b - a)*(r - 1))
+                q = (q - 1)*(r - 1)*(s - 1)
+            if p > 0: q = -q
+            else: p = -p
+            if 2*p < min(3*m*q - abs(tol*q), abs(e*q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = f(b)
+    return None
+
+def _bisect(f, lo:float, hi:float, xtol:float=1e-9, maxiter:int=40) -> float:
+    """Bisection on [lo,hi]; one f() call per halving."""
+    flo = f(lo)
+    for _ in range(maxiter):
+        mid = (lo + hi) / 2
+        fmid = f(mid)
+        if flo * fmid <= 0: hi = mid
+        else: lo, flo = mid, fmid
+        if hi - lo < xtol: break
+    return (lo + hi) / 2
+
+def _term_residual(jd:float, target_deg:float) -> float:
+    """Signed sun-longitude minus target_deg, wrapped to [-180,180)."""
+    return ((sun_ecliptic_longitude_deg(jd) - target_deg + 540) % 360) - 180
+
+def _refine_term_time(jd:float, target_deg:float, xtol:float=1e-9, maxiter:int=8) -> Optional[float]:
+    """Secant root search for target_deg from a nearby guess: the mid-month date, the same
+    term a year away, or the birth instant (for the jeol just before/after it).
+
+    Returns None if it has not converged after maxiter steps.
+    """
+    f0 = _term_residual(jd, target_deg)
+    jd1 = jd - f0 * _TROPICAL_YEAR_DAYS / 360.0  # fixed-slope Newton step to start
+    for _ in range(maxiter):
+        if abs(jd1 - jd) < xtol:
+            return jd1
+        f1 = _term_residual(jd1, target_deg)
+        if f1 == f0:
+            return jd1
+        jd, jd1, f0 = jd1, jd1 - f1 * (jd1 - jd) / (f1 - f0), f1
+    return None
+
+@functools.lru_cache(maxsize=4096)
 def _find_term_time_near(year:int, target_deg:float, guess_month:int) -> float:
-    """Find UT JD when sun longitude hits target_deg, near guess_month."""
+    """Find UT JD when sun longitude hits target_deg, near guess_month (memoized per term/year)."""
     JD0 = gregorian_to_jd(year, guess_month, 15, 0, 0, 0)
     lo, hi = JD0 - 40, JD0 + 40
+    # Longitude is smooth and nearly linear in JD: secant from the mid-month guess
+    # (first step uses the mean slope) converges in a few evaluations.
+    root = _refine_term_time(JD0, target_deg)
+    if root is not None and lo <= root <= hi:
+        return root
+    # Safeguard: bracketed Brent on the +/-40 day window, then plain bisection.
     def f(jd):
-        return ((sun_ecliptic_longitude_deg(jd) - target_deg + 540) % 360) - 180
-    for _ in range(80):
-        mid = (lo + hi) / 2
-        if f(lo) * f(mid) <= 0: hi = mid
-        else: lo = mid
-    return (lo + hi) / 2
+        return _term_residual(jd, target_deg)
+    root = _brentq(f, lo, hi)
+    if root is not None:
+        return root
+    # No sign change on the bracket: fall back to plain bisection.
+    return _bisect(f, lo, hi)
 
 # ── Year pillar (立春 boundary) ──────────────────────────────────────────────
+# Lichun falls within about -1..+1.3 days of Feb 4 00:00 UT (1890-2110); outside this
+# window around that instant, the side of the boundary is known without solving for it.
+_LICHUN_WINDOW_DAYS = 3.0
 def year_pillar(JD_utc:float, civil_year:int) -> str:
-    lichun = _find_term_time_near(civil_year, 315.0, 2)
-    y = civil_year if JD_utc >= lichun else civil_year - 1
+    feb4 = gregorian_to_jd(civil_year, 2, 4, 0, 0, 0)
+    if JD_utc < feb4 - _LICHUN_WINDOW_DAYS:
+        y = civil_year - 1
+    elif JD_utc > feb4 + _LICHUN_WINDOW_DAYS:
+        y = civil_year
+    else:
+        lichun = _find_term_time_near(civil_year, 315.0, 2)
+        y = civil_year if JD_utc >= lichun else civil_year - 1
     # 1984 = 甲子年 baseline
     return ganzhi_from_index((y - 1984) % 60)
 
 # ── Month pillar from instantaneous solar longitude ─────────────────────────
 # 寅月: [315°,345°), 卯月: [345°,15°), …, 丑月: [285°,315°)
-_STEM_START_FROM_YEAR_STEM = {
-    '甲':'丙','己':'丙',
-    '乙':'戊','庚':'戊',
-    '丙':'庚','辛':'庚',
-    '丁':'壬','壬':'壬',
-    '戊':'甲','癸':'甲',
-}
+# 寅月 stem index by year-stem index: 甲己→丙, 乙庚→戊, 丙辛→庚, 丁壬→壬, 戊癸→甲
+_MONTH_STEM_START_IDX = (2, 4, 6, 8, 0, 2, 4, 6, 8, 0)
 def month_pillar_from_longitude(solar_long_deg:float, year_gz:str) -> str:
     offset = (solar_long_deg - 315.0) % 360.0
     m_idx = int(offset // 30.0)  # 0..11 (0=寅, 11=丑)
-    branch = TWELVE_BRANCHES[(2 + m_idx) % 12]  # 寅 index=2
-    y_stem = year_gz[0]
-    stem_start = _STEM_START_FROM_YEAR_STEM[y_stem]
-    s0 = TEN_STEMS.index(stem_start)
-    stem = TEN_STEMS[(s0 + m_idx) % 10]
-    return stem + branch
+    b = (2 + m_idx) % 12  # 寅 index=2
+    s0 = _MONTH_STEM_START_IDX[_STEM_IDX[year_gz[0]]]
+    return _STEM_BRANCH_120[((s0 + m_idx) % 10) * 12 + b]
 
 # ── Day pillar (local midnight boundary; epoch tuned) ───────────────────────
-# Epoch constant chosen so 1988-01-27 (KST) -> 辛巳.
-_DAY_EPOCH_CONST = 50
+# The day cycle is linear in the civil date's proleptic ordinal; offset chosen so
+# 1988-01-27 -> 辛巳 (index 17).
+_DAY_ORDINAL_OFFSET = (17 - datetime.date(1988, 1, 27).toordinal()) % 60
 def day_pillar_local_midnight(y:int,m:int,d:int, tz_hours:float) -> str:
-    jd0 = gregorian_to_jd(y,m,d, -tz_hours, 0, 0)  # local 00:00 -> UTC JD
-    idx = (int(jd0 + 0.5) + _DAY_EPOCH_CONST) % 60
-    return ganzhi_from_index(idx)
+    # The boundary is local midnight, so only the local civil date matters;
+    # tz_hours is kept for API compatibility.
+    return _GANZHI_60[(datetime.date(y, m, d).toordinal() + _DAY_ORDINAL_OFFSET) % 60]
 
 # ── Hour pillar (12 double-hours; exact boundary → previous bin) ────────────
 def _lmt_shift_minutes(lon_deg:float, tz_hours:float) -> float:
     return lon_deg*4.0 - tz_hours*60.0  # LMT - civil minutes
 
+# 子시 stem index by day-stem index: 甲己→甲, 乙庚→丙, 丙辛→戊, 丁壬→庚, 戊癸→壬
+_HOUR_STEM_START_IDX = (0, 2, 4, 6, 8, 0, 2, 4, 6, 8)
 def hour_pillar(day_gz:str, hour:int, minute:int, use_lmt:bool, lon_deg:float, tz_hours:float) -> str:
-    minutes = hour*60 + minute + (_lmt_shift_minutes(lon_deg, tz_hours) if use_lmt else 0.0)
-    minutes %= 1440.0
-    # Offset from 23:00 (子시 origin)
-    offset = (minutes - 23*60) % 1440.0  # in [0,1440)
-    # Put EXACT boundaries (0,120,240,...) into the PREVIOUS bin
-    eps = 1e-7
-    offset_adj = (offset - eps) % 1440.0
-    bin_idx = int(offset_adj // 120.0)  # 0..11 => 子..亥
-    branch = TWELVE_BRANCHES[bin_idx]
-    start_for_zi = {
-        '甲':'甲','己':'甲',
-        '乙':'丙','庚':'丙',
-        '丙':'戊','辛':'戊',
-        '丁':'庚','壬':'庚',
-        '戊':'壬','癸':'壬',
-    }[day_gz[0]]
-    s0 = TEN_STEMS.index(start_for_zi)
-    stem = TEN_STEMS[(s0 + bin_idx) % 10]
-    return stem + branch
+    # Work in integer milliseconds; only the LMT shift is fractional, rounded once.
+    ms = (hour*60 + minute) * 60000
+    if use_lmt:
+        ms += int(round(_lmt_shift_minutes(lon_deg, tz_hours) * 60000))
+    # Offset from 23:00 (子시 origin); the -1 ms puts EXACT boundaries into the PREVIOUS bin
+    offset = (ms - 23*3600000 - 1) % 86400000
+    bin_idx = offset // 7200000  # 0..11 => 子..亥
+    s0 = _HOUR_STEM_START_IDX[_STEM_IDX[day_gz[0]]]
+    return _STEM_BRANCH_120[((s0 + bin_idx) % 10) * 12 + bin_idx]
 
 # ── Main ────────────────────────────────────────────────────────────────────
 
 # luck_cycles (10-year luck cycles) helpers
 _TROPICAL_YEAR_DAYS = 365.242196
-_TERMS12 = [
-    (315.0, "입춘", 2),
-    (345.0, "경칩", 3),
-    (15.0,  "청명", 4),
-    (45.0,  "입하", 5),
-    (75.0,  "망종", 6),
-    (105.0, "소서", 7),
-    (135.0, "입추", 8),
-    (165.0, "백로", 9),
-    (195.0, "한로", 10),
-    (225.0, "입동", 11),
-    (255.0, "대설", 12),
-    (285.0, "소한", 1),
-]
+# 12 jeol terms as parallel arrays, indexed 0..11 from 입춘 (see _term_index_from_longitude)
+_TERM_DEGS = (315.0, 345.0, 15.0, 45.0, 75.0, 105.0, 135.0, 165.0, 195.0, 225.0, 255.0, 285.0)
+_TERM_NAMES = ("입춘", "경칩", "청명", "입하", "망종", "소서", "입추", "백로", "한로", "입동", "대설", "소한")
 def _i60_from_ganzhi(gz: str) -> int:
-    stem = gz[0]
-    branch = gz[1]
-    s = TEN_STEMS.index(stem)
-    b = TWELVE_BRANCHES.index(branch)
-    for i in range(60):
-        if i % 10 == s and i % 12 == b:
-            return i
-    raise ValueError(f"Invalid ganzhi pair: {gz!r}")
+    try:
+        s = _STEM_IDX[gz[0]]
+        b = _BRANCH_IDX[gz[1]]
+    except KeyError as e:
+        raise ValueError(f"Invalid ganzhi char: {gz!r}") from e
+    if (s - b) % 2:
+        raise ValueError(f"Invalid ganzhi pair: {gz!r}")
+    # CRT: i ≡ s (mod 10), i ≡ b (mod 12) has the solution 6s - 5b when s ≡ b (mod 2)
+    return (6*s - 5*b) % 60
 
 def jd_to_gregorian(jd: float):
-    """Convert JD (UT) to Gregorian calendar date/time."""
+    """Convert JD (UT) to Gregorian calendar date/time (proleptic, integer day algorithm)."""
     jd = jd + 0.5
-    Z = int(jd)
-    F = jd - Z
-    if Z < 2299161:
-        A = Z
-    else:
-        alpha = int((Z - 1867216.25) / 36524.25)
-        A = Z + 1 + alpha - int(alpha / 4)
-    B = A + 1524
-    C = int((B - 122.1) / 365.25)
-    D = int(365.25 * C)
-    E = int((B - D) / 30.6001)
-    day = B - D - int(30.6001 * E) + F
-
-    month = E - 1 if E < 14 else E - 13
-    year = C - 4716 if month > 2 else C - 4715
-
-    d_int = int(day)
-    frac = day - d_int
-    hour = int(frac * 24)
-    frac = frac * 24 - hour
-    minute = int(frac * 60)
-    frac = frac * 60 - minute
-    second = int(round(frac * 60))
-
-    if second == 60:
-        second = 59
-    return year, month, d_int, hour, minute, second
+    z = int(jd)
+    secs = int(round((jd - z) * 86400))
+    if secs == 86400:
+        z += 1; secs = 0
+    f = z + 1401 + (((4*z + 274277) // 146097) * 3) // 4 - 38
+    e = 4*f + 3
+    g = (e % 1461) // 4
+    h = 5*g + 2
+    day = (h % 153) // 5 + 1
+    month = (h // 153 + 2) % 12 + 1
+    year = e // 1461 - 4716 + (12 + 2 - month) // 12
+    hour, rem = divmod(secs, 3600)
+    minute, second = divmod(rem, 60)
+    return year, month, day, hour, minute, second
 
 
 # ── Gregorian → Lunar (Chinese/Korean lunisolar; table-based) ─────────────────
@@ -260,12 +345,35 @@ def _lunar_month_days(year: int, month: int) -> int:
 
 
 def _lunar_year_days(year: int) -> int:
-    days = 29 * 12
+    # Month 1..12 big-month flags are bits 15..4 (0x10000 >> month): popcount of 0xFFF0.
     info = _LUNAR_INFO_1900[year - 1900]
+    return 29 * 12 + bin(info & 0xFFF0).count('1') + _lunar_leap_days(year)
+
+
+@functools.lru_cache(maxsize=None)
+def _lunar_year_starts() -> tuple:
+    """Day offsets from lunar 1900-01-01 to the start of lunar years 1900..2101 (prefix sums)."""
+    starts = [0]
+    for year in range(1900, 2101):
+        starts.append(starts[-1] + _lunar_year_days(year))
+    return tuple(starts)
+
+
+@functools.lru_cache(maxsize=256)
+def _lunar_month_table(year: int):
+    """(day offsets of each month start within the year, matching (month, is_leap) labels)."""
+    leap_month = _lunar_leap_month(year)
+    starts, labels = [], []
+    offset = 0
     for month in range(1, 13):
-        if info & (0x10000 >> month):
-            days += 1
-    return days + _lunar_leap_days(year)
+        starts.append(offset)
+        labels.append((month, False))
+        offset += _lunar_month_days(year, month)
+        if month == leap_month:
+            starts.append(offset)
+            labels.append((month, True))
+            offset += _lunar_leap_days(year)
+    return tuple(starts), tuple(labels)
 
 
 def gregorian_to_lunar(y: int, m: int, d: int):
@@ -285,67 +393,79 @@ def gregorian_to_lunar(y: int, m: int, d: int):
         return None
 
     offset = (target - base).days
-    lunar_year = 1900
-    while lunar_year < 2101:
-        year_days = _lunar_year_days(lunar_year)
-        if offset < year_days:
-            break
-        offset -= year_days
-        lunar_year += 1
-
-    leap_month = _lunar_leap_month(lunar_year)
-    lunar_month = 1
-    is_leap = False
-    while lunar_month <= 12:
-        month_days = _lunar_leap_days(lunar_year) if is_leap else _lunar_month_days(lunar_year, lunar_month)
-        if offset < month_days:
-            lunar_day = offset + 1
-            return lunar_year, lunar_month, lunar_day, is_leap
-        offset -= month_days
-
-        if leap_month and lunar_month == leap_month and not is_leap:
-            is_leap = True
-        else:
-            if is_leap:
-                is_leap = False
-            lunar_month += 1
+    year_starts = _lunar_year_starts()
+    i = bisect.bisect_right(year_starts, offset) - 1
+    if i >= len(year_starts) - 1:
+        return None
+    lunar_year = 1900 + i
+    offset -= year_starts[i]
 
-    return None
+    month_starts, month_labels = _lunar_month_table(lunar_year)
+    j = bisect.bisect_right(month_starts, offset) - 1
+    lunar_month, is_leap = month_labels[j]
+    return lunar_year, lunar_month, offset - month_starts[j] + 1, is_leap
 
 def _term_index_from_longitude(solar_long_deg: float) -> int:
     offset = (solar_long_deg - 315.0) % 360.0
     return int(offset // 30.0)  # 0..11
 
-def _term_time_candidates_near(birth_year: int, deg: float, guess_month: int):
-    years = [birth_year - 1, birth_year, birth_year + 1]
+@functools.lru_cache(maxsize=1024)
+def _term_time_candidates_near(birth_year: int, term_idx: int) -> tuple:
+    """JDs of jeol term_idx in birth_year-1, birth_year, birth_year+1 (memoized)."""
+    deg = _TERM_DEGS[term_idx]
+    guess_month = (term_idx + 1) % 12 + 1  # 입춘 → 2, …, 대설 → 12, 소한 → 1
+    JD_mid = _find_term_time_near(birth_year, deg, guess_month)
+    # Neighbouring years: refine from JD_mid -/+ one tropical year instead of a full search.
     out = []
-    for y in years:
-        out.append(_find_term_time_near(y, deg, guess_month))
-    return out
-
-def _next_prev_term_times(JD_birth_utc: float, birth_year: int, next_term, prev_term):
-    next_deg, next_name, next_guess_m = next_term
-    prev_deg, prev_name, prev_guess_m = prev_term
+    for dy in (-1, 0, +1):
+        if dy == 0:
+            out.append(JD_mid)
+            continue
+        jd = _refine_term_time(JD_mid + dy * _TROPICAL_YEAR_DAYS, deg)
+        if jd is None:
+            jd = _find_term_time_near(birth_year + dy, deg, guess_month)
+        out.append(jd)
+    return tuple(out)
+
+@functools.lru_cache(maxsize=1024)
+def _next_prev_term_times(JD_birth_utc: float, birth_year: int, next_idx: int, prev_idx: int):
+    """((JD, name, deg) of the next jeol, same for the previous one); memoized per birth."""
+    # Jeol terms are ~30.4 days apart and the birth lies between prev and next, so each
+    # is a single root within ~31 days of birth: solve directly from JD_birth_utc.
+    JD_next = _refine_term_time(JD_birth_utc, _TERM_DEGS[next_idx])
+    JD_prev = _refine_term_time(JD_birth_utc, _TERM_DEGS[prev_idx])
+    if (JD_next is not None and JD_prev is not None
+            and JD_birth_utc - 1 <= JD_next <= JD_birth_utc + 35
+            and JD_birth_utc - 35 <= JD_prev <= JD_birth_utc + 1):
+        return (
+            (JD_next, _TERM_NAMES[next_idx], _TERM_DEGS[next_idx]),
+            (JD_prev, _TERM_NAMES[prev_idx], _TERM_DEGS[prev_idx]),
+        )
 
+    # Last-resort safeguard, not taken for 1900-2100 births: pick from the term's times in
+    # the neighbouring civil years (also memoized, via _term_time_candidates_near).
     eps = 1e-9
 
-    next_candidates = _term_time_candidates_near(birth_year, next_deg, next_guess_m)
+    next_candidates = _term_time_candidates_near(birth_year, next_idx)
     next_after = [jd for jd in next_candidates if jd > JD_birth_utc + eps]
     if not next_after:
         next_after = next_candidates
     JD_next = min(next_after, key=lambda jd: jd - JD_birth_utc)
 
-    prev_candidates = _term_time_candidates_near(birth_year, prev_deg, prev_guess_m)
+    prev_candidates = _term_time_candidates_near(birth_year, prev_idx)
     prev_before = [jd for jd in prev_candidates if jd < JD_birth_utc - eps]
     if not prev_before:
         prev_before = prev_candidates
     JD_prev = max(prev_before, key=lambda jd: jd - JD_birth_utc)
 
-    return (JD_next, next_name, next_deg), (JD_prev, prev_name, prev_deg)
+    return (
+        (JD_next, _TERM_NAMES[next_idx], _TERM_DEGS[next_idx]),
+        (JD_prev, _TERM_NAMES[prev_idx], _TERM_DEGS[prev_idx]),
+    )
 
 
 def _is_yang_stem(stem: str) -> bool:
-    return (TEN_STEMS.index(stem) % 2) == 0
+    return (_STEM_IDX[stem] % 2) == 0
 
 
 def _add_years_clamped(dt: datetime.datetime, years: int) -> datetime.datetime:
@@ -378,20 +498,21 @@ def luck_cycles_info(
     gz_month: str,
     direction: int,
     cycles: int = 10,
+    lam: Optional[float] = None,
 ):
-    """Compute 10-year luck cycles for selected direction (+1 forward, -1 backward)."""
+    """Compute 10-year luck cycles for selected direction (+1 forward, -1 backward).
+
+    lam: solar longitude at JD_birth_utc, if already known (e.g. from manse_calc).
+    """
     if direction not in (+1, -1):
         raise ValueError('direction must be +1 (forward) or -1 (backward)')
 
-    lam = sun_ecliptic_longitude_deg(JD_birth_utc)
+    if lam is None:
+        lam = sun_ecliptic_longitude_deg(JD_birth_utc)
     idx = _term_index_from_longitude(lam)
 
-    cur_term = _TERMS12[idx]
-    next_term = _TERMS12[(idx + 1) % 12]
-    prev_term = _TERMS12[idx]
-
     (JD_next, next_name, next_deg), (JD_prev, prev_name, prev_deg) = _next_prev_term_times(
-        JD_birth_utc, birth_year, next_term, prev_term
+        JD_birth_utc, birth_year, (idx + 1) % 12, idx
     )
 
     def jd_iso(jd):
@@ -418,24 +539,24 @@ def luck_cycles_info(
 
     base = _i60_from_ganzhi(gz_month)
 
-    out_cycles = []
-    for n in range(1, cycles + 1):
-        i60 = (base + direction * n) % 60
-        age_start = start_years + (n - 1) * 10.0
-        age_end = start_years + n * 10.0
-        cycle_start_dt = start_dt + datetime.timedelta(days=(n - 1) * 10.0 * _TROPICAL_YEAR_DAYS)
-        cycle_end_dt = (start_dt + datetime.timedelta(days=n * 10.0 * _TROPICAL_YEAR_DAYS)) - datetime.timedelta(seconds=1)
-        out_cycles.append({
+    # Cycle boundaries: bounds[k] = start of cycle k+1 (each cycle ends 1s before the next).
+    one_sec = datetime.timedelta(seconds=1)
+    bounds = [start_dt + datetime.timedelta(days=k * 10.0 * _TROPICAL_YEAR_DAYS) for k in range(cycles + 1)]
+    out_cycles = [
+        {
             'n': n,
-            'age_start': age_start,
-            'age_end': age_end,
-            'date_start': dt_iso_local(cycle_start_dt),
-            'date_end': dt_iso_local(cycle_end_dt),
-            'pillar': ganzhi_from_index(i60),
-        })
+            'age_start': start_years + (n - 1) * 10.0,
+            'age_end': start_years + n * 10.0,
+            'date_start': dt_iso_local(bounds[n - 1]),
+            'date_end': dt_iso_local(bounds[n] - one_sec),
+            'pillar': _GANZHI_60[(base + direction * n) % 60],
+        }
+        for n in range(1, cycles + 1)
+    ]
 
     luck_cycles_start_date = dt_iso_local(start_dt)
-    luck_cycles_end_date = dt_iso_local((start_dt + datetime.timedelta(days=cycles * 10.0 * _TROPICAL_YEAR_DAYS)) - datetime.timedelta(seconds=1))
+    # Not bounds[cycles]: bounds is empty when cycles < 0, which the CLI accepts.
+    luck_cycles_end_date = dt_iso_local(start_dt + datetime.timedelta(days=cycles * 10.0 * _TROPICAL_YEAR_DAYS) - one_sec)
 
     return {
         'rule': {
@@ -448,7 +569,7 @@ def luck_cycles_info(
         },
         'direction': dir_name,
         'birth_longitude_deg': lam,
-        'current_term': {'name': cur_term[1], 'deg': cur_term[0]},
+        'current_term': {'name': _TERM_NAMES[idx], 'deg': _TERM_DEGS[idx]},
         'to_term': {'name': term_name, 'deg': term_deg, 'jd_utc': JD_target, 'utc': jd_iso(JD_target)},
         'days': days,
         'start_age_years': start_years,
@@ -466,7 +587,8 @@ def manse_calc(y:int,m:int,d:int, hh:int, mm:int, tz:float, lon:float, use_lmt:b
     gz_month = month_pillar_from_longitude(lam, gz_year)
     gz_day = day_pillar_local_midnight(y,m,d, tz_hours=tz)
     gz_hour = hour_pillar(gz_day, hh, mm, use_lmt=use_lmt, lon_deg=lon, tz_hours=tz)
-    return gz_year, gz_month, gz_day, gz_hour
+    # JD_utc and lam are returned so callers (luck_cycles_info) need not recompute them.
+    return gz_year, gz_month, gz_day, gz_hour, JD_utc, lam
 
 # ── CLI ─────────────────────────────────────────────────────────────────────
 
@@ -508,6 +630,21 @@ def parse_compact_datetime(stamp: str):
 
     return is_female, y, m, d, hh, mm
 
+_DATE_RE = re.compile(r"^(\d{1,4})-(\d{1,2})-(\d{1,2})$")
+_TIME_RE = re.compile(r"^(\d{1,2}):(\d{1,2})$")
+
+def parse_date_time(date: str, time: str):
+    """Parse --date YYYY-MM-DD and --time HH:MM into (y, m, d, hh, mm)."""
+    dm = _DATE_RE.match(date.strip())
+    if dm is None:
+        raise ValueError('date must be YYYY-MM-DD')
+    tm = _TIME_RE.match(time.strip())
+    if tm is None:
+        raise ValueError('time must be HH:MM')
+    y, m, d = map(int, dm.groups())
+    hh, mm = map(int, tm.groups())
+    return y, m, d, hh, mm
+
 def _format_ymdhm(y: int, m: int, d: int, hh: int, mm: int) -> str:
     return f"{y:04d}-{m:02d}-{d:02d} {hh:02d}:{mm:02d}"
 
@@ -520,6 +657,16 @@ def _iso_to_ymdhm(stamp: Optional[str]) -> Optional[str]:
     stamp = stamp.replace("T", " ").strip()
     return stamp[:16]
 
+def _dumps_json(obj) -> str:
+    """Pretty-print obj as JSON (2-space indent, non-ASCII kept as-is).
+
+    With orjson the output is JSON-equivalent to the stdlib path, not byte-identical:
+    orjson writes small floats positionally (0.0000138...) where json uses repr (1.38...e-05).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
 def _normalize_age_years(age_years: float):
     if isinstance(age_years, bool) or not isinstance(age_years, (int, float)):
         return age_years
@@ -562,11 +709,16 @@ if __name__ == "__main__":
     else:
         if not args.date:
             p.error("positional stamp or --date is required")
-        y, m, d = map(int, args.date.split("-"))
-        hh, mm = map(int, args.time.split(":"))
+        try:
+            y, m, d, hh, mm = parse_date_time(args.date, args.time)
+        except ValueError as e:
+            p.error(str(e))
         is_female = bool(args.female)
-    gz_year, gz_month, gz_day, gz_hour = manse_calc(y,m,d,hh,mm,args.tz,args.lon,args.lmt)
-    JD_utc = gregorian_to_jd(y,m,d, hh - args.tz, mm, 0)
+    try:
+        birth_dt = datetime.datetime(y, m, d, hh, mm)
+    except ValueError as e:
+        p.error(str(e))
+    gz_year, gz_month, gz_day, gz_hour, JD_utc, lam = manse_calc(y,m,d,hh,mm,args.tz,args.lon,args.lmt)
 
     lunar_r = gregorian_to_lunar(y, m, d)
     lunar_str = None
@@ -576,7 +728,7 @@ if __name__ == "__main__":
         yoon = bool(lunar_r[3])
 
     verbose_result = {
-        "gregorian": datetime.datetime(y, m, d, hh, mm).isoformat(timespec='seconds'),
+        "gregorian": birth_dt.isoformat(timespec='seconds'),
         "lunar": lunar_str,
         "yoon": yoon,
         "ganzhi": {
@@ -589,10 +741,11 @@ if __name__ == "__main__":
         "luck_cycles": luck_cycles_info(
             JD_utc,
             y,
-            datetime.datetime(y, m, d, hh, mm),
+            birth_dt,
             gz_month,
             luck_cycles_direction(gz_year, is_female=is_female),
             cycles=args.cycle,
+            lam=lam,
         )
     }
 
@@ -619,4 +772,4 @@ if __name__ == "__main__":
         "verbose": verbose_result,
     }
 
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(_dumps_json(result))